@@ -5,30 +5,422 @@ Provides a comprehensive interface for managing and editing attribute tables.
 """
 
 import os
-from qgis.PyQt.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from datetime import datetime
+
+import numpy as np
+from qgis.PyQt.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                  QComboBox, QPushButton, QTextEdit, QGroupBox,
                                  QCheckBox, QProgressBar, QMessageBox,
-                                 QTableWidget, QTableWidgetItem, QHeaderView, QSplitter,
+                                 QTableView, QAbstractItemView, QHeaderView, QSplitter,
                                  QTabWidget, QWidget, QLineEdit, QSpinBox, QFormLayout,
-                                 QMenu, QApplication, QScrollArea, QFrame)
-from qgis.PyQt.QtCore import Qt, QThread, pyqtSignal, QTimer
-from qgis.PyQt.QtGui import QFont, QIcon
-from qgis.core import QgsProject, QgsVectorLayer, QgsFeature, QgsField, NULL
+                                 QMenu, QApplication, QScrollArea, QFrame,
+                                 QStackedWidget)
+from qgis.PyQt.QtCore import (Qt, QThread, pyqtSignal, QTimer,
+                              QAbstractTableModel, QModelIndex,
+                              QSortFilterProxyModel, QSignalBlocker,
+                              QStringListModel)
+from qgis.PyQt.QtGui import QFont, QIcon, QBrush, QKeySequence
+from qgis.core import (QgsProject, QgsMapLayer, QgsVectorLayer, QgsFeature,
+                       QgsField, QgsFeatureRequest, NULL)
+
+
+# Doubles quotes when escaping clipboard cells, without intermediate strings
+_QUOTE_ESCAPE_MAP = {ord('"'): '""'}
+
+# Rows fetched per fetchMore() call while scrolling through a large layer
+FETCH_CHUNK = 1000
+
+
+def _display_value(value):
+    """Convert a raw attribute value to its display string ('' for NULL)."""
+    if value == NULL or value is None:
+        return ""
+    return str(value)
+
+
+def _make_converter(field_type):
+    """Build a converter turning an edited string into a typed field value.
+
+    Empty and null-ish strings become NULL; failed conversions fall back
+    to the original string, matching the previous per-call behavior.
+    """
+    if field_type in (1, 2):  # Integer types
+        cast = int
+    elif field_type in (3, 4):  # Double/Real types
+        cast = float
+    elif field_type == 10:  # Date type
+        def cast(value):
+            return datetime.strptime(value, "%Y-%m-%d").date()
+    else:  # String and other types pass through
+        cast = None
+
+    def convert(value):
+        if value == "" or value.lower() in ("null", "none"):
+            return NULL
+        if cast is None:
+            return value
+        try:
+            return cast(value)
+        except (ValueError, TypeError):
+            return value
+
+    return convert
+
+
+class AttributeTableModel(QAbstractTableModel):
+    """Table model exposing a layer's attribute values to a QTableView.
+
+    Values are stored column-wise (one object ndarray per field) and handed
+    to the view on demand, so only the cells currently visible in the
+    viewport are materialized. The original-value snapshot used for change
+    tracking and revert lives in matching object ndarrays (~8 bytes per
+    cell slot) rather than a (row, col) -> str dict, so tracking memory
+    stays flat and lookups skip tuple hashing.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cols = []  # One object ndarray of display strings per field
+        self._original = []  # Per-column snapshot of loaded values for revert
+        self._loaded_rows = 0  # Rows fetched so far; rowCount() reports this
+        self._capacity = 0  # Allocated length of the column arrays
+        self._iterator = None  # Pending QgsFeatureIterator, None when drained
+        self._feature_ids = []  # Row -> feature id
+        self._header_labels = []
+        self._row_lower = []  # Per-row concatenated lowercase search strings
+        self._col_lower = []  # Per-column lists of lowercase values
+        self.changed_cells = set()  # (row, col) edited since load
+        self.invalid_cells = set()  # (row, col) failing field validation
+        self.validator = None  # callable(col, text) -> bool
+        self._changed_brush = QBrush(Qt.yellow)  # Valid but unsaved
+        self._invalid_brush = QBrush(Qt.red)  # Invalid data
+
+    def set_layer_source(self, header_labels, layer, request):
+        """Reset the model to stream the layer's features in lazily.
+
+        Only the first chunk is fetched up front; Qt pulls further chunks
+        through canFetchMore/fetchMore as the user scrolls.
+        """
+        self.beginResetModel()
+        self._header_labels = list(header_labels)
+        ncols = len(self._header_labels)
+        self._iterator = layer.getFeatures(request)
+        self._loaded_rows = 0
+        self._capacity = 0
+        self._cols = [np.empty(0, dtype=object) for _ in range(ncols)]
+        self._original = [np.empty(0, dtype=object) for _ in range(ncols)]
+        self._col_lower = [[] for _ in range(ncols)]
+        self._row_lower = []
+        self._feature_ids = []
+        self.changed_cells.clear()
+        self.invalid_cells.clear()
+        self._append_rows(*self._read_chunk())
+        self.endResetModel()
+
+    def _read_chunk(self):
+        """Pull up to FETCH_CHUNK features from the pending iterator."""
+        rows = []
+        fids = []
+        if self._iterator is None:
+            return rows, fids
+        for feature in self._iterator:
+            rows.append(feature.attributes())
+            fids.append(feature.id())
+            if len(rows) >= FETCH_CHUNK:
+                break
+        if len(rows) < FETCH_CHUNK:
+            self._iterator = None  # Drained
+        return rows, fids
+
+    def _append_rows(self, rows, fids):
+        """Append fetched rows to the column arrays and search index."""
+        count = len(rows)
+        if not count:
+            return
+        start = self._loaded_rows
+        needed = start + count
+        if needed > self._capacity:
+            grow = max(needed, self._capacity * 2)
+            extra = np.empty(grow - self._capacity, dtype=object)
+            self._cols = [np.concatenate([col, extra]) for col in self._cols]
+            self._original = [np.concatenate([col, extra]) for col in self._original]
+            self._capacity = grow
+
+        arr = np.array(rows, dtype=object)
+        for col in range(len(self._cols)):
+            display = [_display_value(v) for v in arr[:, col]]
+            self._cols[col][start:needed] = display
+            self._original[col][start:needed] = display
+            self._col_lower[col].extend(v.lower() for v in display)
+        self._feature_ids.extend(fids)
+        self._loaded_rows = needed
+        if self._cols:
+            for row in range(start, needed):
+                self._row_lower.append(' '.join(c[row] for c in self._cols).lower())
+        else:
+            self._row_lower.extend([''] * count)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._iterator is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        rows, fids = self._read_chunk()
+        if not rows:
+            return
+        start = self._loaded_rows
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._append_rows(rows, fids)
+        self.endInsertRows()
+
+    def ensure_fully_loaded(self):
+        """Synchronously fetch all remaining rows (filters must see them all)."""
+        while self._iterator is not None:
+            self.fetchMore()
+
+    def ensure_loaded_through(self, row):
+        """Fetch until the given row index is available (or the layer ends)."""
+        while self._iterator is not None and self._loaded_rows <= row:
+            self.fetchMore()
+
+    def feature_id(self, row):
+        """Return the layer feature id backing a model row."""
+        return self._feature_ids[row]
+
+    def _rebuild_search_index(self):
+        """Precompute lowercase search strings so filtering never re-lowers cells."""
+        loaded = self._loaded_rows
+        self._col_lower = [[v.lower() for v in col[:loaded]] for col in self._cols]
+        if self._cols:
+            self._row_lower = [' '.join(row).lower()
+                               for row in zip(*(col[:loaded] for col in self._cols))]
+        else:
+            self._row_lower = [''] * loaded
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._header_labels)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if 0 <= section < len(self._header_labels):
+                return self._header_labels[section]
+            return None
+        return section + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._cols[col][row]
+        if role == Qt.BackgroundRole:
+            if (row, col) in self.invalid_cells:
+                return self._invalid_brush
+            if (row, col) in self.changed_cells:
+                return self._changed_brush
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        text = "" if value is None else str(value)
+        if self._cols[col][row] == text:
+            return True
+
+        self._cols[col][row] = text
+        self._col_lower[col][row] = text.lower()
+        self._row_lower[row] = ' '.join(c[row] for c in self._cols).lower()
+        cell = (row, col)
+        if text != self._original[col][row]:
+            self.changed_cells.add(cell)
+            if self.validator and not self.validator(col, text):
+                self.invalid_cells.add(cell)
+            else:
+                self.invalid_cells.discard(cell)
+        else:
+            self.changed_cells.discard(cell)
+            self.invalid_cells.discard(cell)
+
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.BackgroundRole])
+        return True
+
+    def paste_block(self, start_row, start_col, values):
+        """Bulk-assign a rectangle of display strings, clipped to bounds.
+
+        :param values: list of per-row lists of strings (may be ragged)
+        :returns: (changed_count, invalid_count)
+        """
+        if not values:
+            return 0, 0
+        height = min(len(values), self._loaded_rows - start_row)
+        if height <= 0:
+            return 0, 0
+        values = values[:height]
+        width = min(max(len(row) for row in values), len(self._cols) - start_col)
+        if width <= 0:
+            return 0, 0
+
+        # Normalize to a rectangular object array; short rows pad with None
+        block = np.full((height, width), None, dtype=object)
+        for i, row_values in enumerate(values):
+            row_width = min(len(row_values), width)
+            block[i, :row_width] = row_values[:row_width]
+
+        changed = 0
+        invalid = 0
+        for j in range(width):
+            col = start_col + j
+            target = self._cols[col][start_row:start_row + height]
+            new_col = block[:, j]
+            mask = np.not_equal(new_col, None) & np.not_equal(new_col, target)
+            if not mask.any():
+                continue
+            rows_changed = np.nonzero(mask)[0]
+            target[rows_changed] = new_col[rows_changed]
+
+            # Per-cell bookkeeping only for the cells that actually differ
+            col_lower = self._col_lower[col]
+            original = self._original[col]
+            for i in rows_changed.tolist():
+                row = start_row + i
+                text = new_col[i]
+                col_lower[row] = text.lower()
+                cell = (row, col)
+                if text != original[row]:
+                    self.changed_cells.add(cell)
+                    if self.validator and not self.validator(col, text):
+                        self.invalid_cells.add(cell)
+                        invalid += 1
+                    else:
+                        self.invalid_cells.discard(cell)
+                else:
+                    self.changed_cells.discard(cell)
+                    self.invalid_cells.discard(cell)
+                changed += 1
+
+        if changed:
+            for i in range(height):
+                row = start_row + i
+                self._row_lower[row] = ' '.join(c[row] for c in self._cols).lower()
+
+            # One repaint spanning the pasted rectangle
+            self.dataChanged.emit(
+                self.index(start_row, start_col),
+                self.index(start_row + height - 1, start_col + width - 1),
+                [Qt.DisplayRole, Qt.BackgroundRole])
+        return changed, invalid
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def value(self, row, col):
+        """Return the current display string at (row, col)."""
+        return self._cols[col][row]
+
+    def mark_committed(self):
+        """Accept the current valid values as the new baseline after a commit.
+
+        Invalid cells were never written to the provider, so they stay
+        tracked (and highlighted) as unsaved changes.
+        """
+        committed = self.changed_cells - self.invalid_cells
+        if not committed:
+            return
+        for row, col in committed:
+            self._original[col][row] = self._cols[col][row]
+
+        # One repaint to clear the unsaved-change highlighting
+        rows = [cell[0] for cell in committed]
+        cols = [cell[1] for cell in committed]
+        self.changed_cells -= committed
+        self.dataChanged.emit(self.index(min(rows), min(cols)),
+                              self.index(max(rows), max(cols)),
+                              [Qt.BackgroundRole])
+
+    def revert_all(self):
+        """Restore every changed cell to its originally loaded value."""
+        if not self.changed_cells:
+            return
+        for row, col in self.changed_cells:
+            self._cols[col][row] = self._original[col][row]
+
+        # One repaint over the bounding rectangle of the reverted cells
+        rows = [cell[0] for cell in self.changed_cells]
+        cols = [cell[1] for cell in self.changed_cells]
+        self.changed_cells.clear()
+        self.invalid_cells.clear()
+        self._rebuild_search_index()
+        self.dataChanged.emit(self.index(min(rows), min(cols)),
+                              self.index(max(rows), max(cols)),
+                              [Qt.DisplayRole, Qt.BackgroundRole])
+
+
+class AttributeFilterProxyModel(QSortFilterProxyModel):
+    """Proxy model filtering rows against the source's lowercase search index.
+
+    Row acceptance runs inside Qt's C++ filtering machinery; Python is only
+    consulted for one substring test per row on the precomputed index.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ''  # Search text, already lowercased
+        self._field_col = -1  # Column to search, -1 for all fields
+        self._search = None  # Compiled matcher for needles worth compiling
+
+    def set_filter(self, needle, field_col=-1):
+        """Update the search needle and scoped column, then re-filter once."""
+        self._needle = needle
+        self._field_col = field_col
+        if len(needle) >= 3:
+            # re's literal matcher skips ahead Boyer-Moore style, beating a
+            # plain `in` scan once the needle is non-trivial
+            self._search = re.compile(re.escape(needle)).search
+        else:
+            self._search = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._needle:
+            return True
+        source = self.sourceModel()
+        if self._field_col >= 0:
+            haystack = source._col_lower[self._field_col][source_row]
+        else:
+            haystack = source._row_lower[source_row]
+        if self._search is not None:
+            return self._search(haystack) is not None
+        return self._needle in haystack
 
 
 class AttributeTableWidget(QWidget):
     """Widget for displaying and editing a single layer's attribute table."""
-    
+
     def __init__(self, layer, parent=None):
         """Initialize the attribute table widget.
-        
+
         :param layer: QGIS vector layer
         :param parent: Parent widget
         """
         super().__init__(parent)
         self.layer = layer
-        self.original_data = {}  # Store original values
-        self.changed_cells = set()  # Track changed cells
+        self._field_names = []  # Column order, filled by load_data
+        self._fields = None  # Cached QgsFields, refreshed by load_data
+        self._converters = []  # Per-column string -> typed value converters
+        self._last_sel_key = None  # Last selection summary shown in the status bar
         self.init_ui()
         self.load_data()
         
@@ -78,61 +470,100 @@ class AttributeTableWidget(QWidget):
         # Search and filter
         filter_layout = QHBoxLayout()
         filter_layout.addWidget(QLabel('Search:'))
+
+        # Debounce typing so only the final text triggers a filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._do_filter)
+
+        # Coalesce the selection-summary work during drag selection
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(80)
+        self._sel_timer.timeout.connect(self._update_sel_status)
+
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText('Search in all fields...')
-        self.search_input.textChanged.connect(self.filter_data)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(self.search_input)
-        
+
         filter_layout.addWidget(QLabel('Field:'))
         self.field_filter = QComboBox()
         self.field_filter.addItem('All Fields')
-        self.field_filter.currentTextChanged.connect(self.filter_data)
+        self.field_filter.currentTextChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(self.field_filter)
         
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
         
-        # Attribute table
+        # Attribute table (model/view: only visible cells are materialized)
+        self.model = AttributeTableModel(self)
+        self.model.validator = self._is_valid_for_column
+        self.proxy = AttributeFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
         try:
-            self.table = QTableWidget()
+            self.table = QTableView()
+            self.table.setModel(self.proxy)
             self.table.setAlternatingRowColors(True)
-            self.table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.EditKeyPressed | QTableWidget.AnyKeyPressed)
-            self.table.setSelectionBehavior(QTableWidget.SelectItems)  # Use SelectItems for compatibility
-            self.table.setSelectionMode(QTableWidget.ContiguousSelection)  # Use ContiguousSelection for better compatibility
-            self.table.itemChanged.connect(self.on_cell_changed)
-            
+            self.table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed)
+            self.table.setSelectionBehavior(QAbstractItemView.SelectItems)  # Use SelectItems for compatibility
+            self.table.setSelectionMode(QAbstractItemView.ContiguousSelection)  # Use ContiguousSelection for better compatibility
+
             # Set header height to accommodate two-line headers
             header = self.table.horizontalHeader()
+            header.setSectionResizeMode(QHeaderView.Interactive)
             header.setDefaultSectionSize(120)  # Wider columns for field names and types
             header.setMinimumHeight(50)  # Taller header for two-line text
             self.table.setContextMenuPolicy(Qt.CustomContextMenu)
             self.table.customContextMenuRequested.connect(self.show_context_menu)
-            
+
             # Enable drag selection for better user experience
             self.table.setDragEnabled(True)
-            self.table.setDragDropMode(QTableWidget.NoDragDrop)
-            
+            self.table.setDragDropMode(QAbstractItemView.NoDragDrop)
+
             # Add keyboard shortcuts
             self.table.keyPressEvent = self.table_key_press_event
-            
+
             # Connect selection change signal to update visual feedback
             self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
-            
+
         except Exception as e:
             # Fallback to basic table if advanced features fail
             print(f"Warning: Advanced table features not available: {e}")
-            self.table = QTableWidget()
+            self.table = QTableView()
+            self.table.setModel(self.proxy)
             self.table.setAlternatingRowColors(True)
-            self.table.setEditTriggers(QTableWidget.DoubleClicked)
-            self.table.setSelectionBehavior(QTableWidget.SelectItems)
-            self.table.setSelectionMode(QTableWidget.SingleSelection)
-            self.table.itemChanged.connect(self.on_cell_changed)
-            
+            self.table.setEditTriggers(QAbstractItemView.DoubleClicked)
+            self.table.setSelectionBehavior(QAbstractItemView.SelectItems)
+            self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+
             # Set header height to accommodate two-line headers
             header = self.table.horizontalHeader()
+            header.setSectionResizeMode(QHeaderView.Interactive)
             header.setDefaultSectionSize(120)  # Wider columns for field names and types
             header.setMinimumHeight(50)  # Taller header for two-line text
-        
+
+        # Build the context menu once; show_context_menu only execs it
+        self._ctx_menu = QMenu(self)
+
+        edit_action = self._ctx_menu.addAction("Edit Cell")
+        edit_action.triggered.connect(self.edit_current_cell)
+
+        self._ctx_menu.addSeparator()
+
+        copy_action = self._ctx_menu.addAction("Copy Selection")
+        copy_action.triggered.connect(self.copy_selection)
+
+        paste_action = self._ctx_menu.addAction("Paste from Spreadsheet")
+        paste_action.triggered.connect(self.paste_from_excel)
+
+        self._ctx_menu.addSeparator()
+
+        # "Fit Columns to Contents" is expensive, so it stays on demand only
+        fit_columns_action = self._ctx_menu.addAction("Fit Columns to Contents")
+        fit_columns_action.triggered.connect(self.table.resizeColumnsToContents)
+
         layout.addWidget(self.table)
         
         # Status bar
@@ -142,94 +573,113 @@ class AttributeTableWidget(QWidget):
         self.setLayout(layout)
     
     def load_data(self):
-        """Load the layer's attribute data into the table."""
+        """Load the layer's attribute data into the table model."""
         try:
-            # Get fields
+            # Get fields (cached so later lookups avoid the layer round-trip)
             fields = self.layer.fields()
             field_names = [field.name() for field in fields]
-            
+            self._fields = fields
+            self._field_names = field_names
+            self._converters = [_make_converter(field.type()) for field in fields]
+
             # Create headers with field types
             header_labels = []
             for field in fields:
                 field_type = self.get_user_friendly_type_name(field.typeName())
                 header_labels.append(f"{field.name()}\n({field_type})")
-            
+
             # Update field filter
             self.field_filter.clear()
             self.field_filter.addItem('All Fields')
             self.field_filter.addItems(field_names)
-            
-            # Setup table
-            self.table.setColumnCount(len(field_names))
-            self.table.setHorizontalHeaderLabels(header_labels)
-            
-            # Get features
-            features = list(self.layer.getFeatures())
-            self.table.setRowCount(len(features))
-            
-            # Populate table
-            for row, feature in enumerate(features):
-                for col, field_name in enumerate(field_names):
-                    value = feature[field_name]
-                    
-                    # Handle NULL values
-                    if value == NULL or value is None:
-                        display_value = ""
-                    else:
-                        display_value = str(value)
-                    
-                    item = QTableWidgetItem(display_value)
-                    # Ensure the item is editable
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-                    self.table.setItem(row, col, item)
-                    
-                    # Store original value
-                    self.original_data[(row, col)] = display_value
-            
-            # Auto-resize columns
-            self.table.resizeColumnsToContents()
-            
-            # Ensure all cells are editable
-            self._make_all_cells_editable()
-            
-            self.status_label.setText(f'Loaded {len(features)} features with {len(field_names)} fields')
-            
+
+            # Only attributes cross the provider boundary; geometry is never
+            # used here and skipping it cuts per-feature marshaling cost
+            request = QgsFeatureRequest()
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes(list(range(len(fields))))
+
+            # The model streams features in FETCH_CHUNK batches; only the
+            # first chunk is materialized before the table paints
+            with self._silent():
+                self.model.set_layer_source(header_labels, self.layer, request)
+
+            self.status_label.setText(
+                f'Loaded {self.layer.featureCount()} features with {len(field_names)} fields')
+
         except Exception as e:
             self.status_label.setText(f"Error loading data: {str(e)}")
             QMessageBox.critical(self, 'Error Loading Data', f"Failed to load attributes:\n{str(e)}")
-    
-    def filter_data(self):
+
+    def _do_filter(self):
         """Filter the table data based on search text and field selection."""
         search_text = self.search_input.text().lower()
         selected_field = self.field_filter.currentText()
-        
-        for row in range(self.table.rowCount()):
-            row_visible = False
-            
-            for col in range(self.table.columnCount()):
-                if selected_field == 'All Fields' or self.table.horizontalHeaderItem(col).text() == selected_field:
-                    item = self.table.item(row, col)
-                    if item and search_text in item.text().lower():
-                        row_visible = True
-                        break
-            
-            self.table.setRowHidden(row, not row_visible)
-        
-        visible_rows = sum(1 for row in range(self.table.rowCount()) if not self.table.isRowHidden(row))
-        self.status_label.setText(f'Showing {visible_rows} of {self.table.rowCount()} features')
-    
-    
-    def _make_all_cells_editable(self):
-        """Ensure all table cells are editable."""
-        for row in range(self.table.rowCount()):
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-    
+
+        if search_text:
+            # Filtering must see the whole layer, not just the fetched rows
+            self.model.ensure_fully_loaded()
+
+        if selected_field in self._field_names:
+            field_col = self._field_names.index(selected_field)
+        else:
+            field_col = -1  # 'All Fields'
+
+        # The proxy re-filters in one pass; no per-row setRowHidden calls
+        self.proxy.set_filter(search_text, field_col)
+
+        # The model may hold only the streamed-in rows, so the layer's
+        # feature count is the honest total
+        total = self.layer.featureCount()
+        if search_text:
+            self.status_label.setText(f'Showing {self.proxy.rowCount()} of {total} features')
+        else:
+            self.status_label.setText(f'Showing {total} of {total} features')
+
+    def _is_valid_for_column(self, col, text):
+        """Model validator hook: check a value against the column's field type."""
+        field = self.get_field_by_column(col)
+        if field is None:
+            return True
+        is_valid, _ = self.validate_data_for_field(text, field)
+        return is_valid
+
     def update_layer(self):
         """Update the QGIS layer with changes made in the table."""
         try:
+            # Only cells the model tracked as changed need to be written back
+            if not self.model.changed_cells:
+                QMessageBox.information(
+                    self,
+                    "No Changes",
+                    "No changes were detected in the attribute table."
+                )
+                self.status_label.setText("No changes detected")
+                return
+
+            # Group changed cells by row -> {field index: converted value}.
+            # Invalid cells are skipped: their converter would fall back to
+            # the raw string, so the provider would store something other
+            # than what the table shows; they stay highlighted instead
+            invalid_skipped = len(self.model.invalid_cells)
+            changes_by_row = {}
+            for row, col in self.model.changed_cells:
+                if (row, col) in self.model.invalid_cells:
+                    continue
+                new_value = self.model.value(row, col).strip()
+                converted_value = self._converters[col](new_value)
+                changes_by_row.setdefault(row, {})[col] = converted_value
+
+            if not changes_by_row:
+                QMessageBox.warning(
+                    self,
+                    "Invalid Values",
+                    f"All {invalid_skipped} pending changes are invalid for "
+                    f"their field types and were not written."
+                )
+                self.status_label.setText("No valid changes to update")
+                return
+
             # Check if layer is editable
             if not self.layer.isEditable():
                 reply = QMessageBox.question(
@@ -239,60 +689,33 @@ class AttributeTableWidget(QWidget):
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.Yes
                 )
-                
+
                 if reply == QMessageBox.Yes:
                     self.layer.startEditing()
                 else:
                     return
-            
-            # Get all features from the layer
-            features = list(self.layer.getFeatures())
-            fields = self.layer.fields()
-            field_names = [field.name() for field in fields]
-            
+
             # Track changes
             changes_made = 0
-            
-            # Update each feature
-            for row in range(self.table.rowCount()):
-                if row < len(features):
-                    feature = features[row]
-                    feature_changed = False
-                    
-                    # Update each field
-                    for col, field_name in enumerate(field_names):
-                        if col < self.table.columnCount():
-                            item = self.table.item(row, col)
-                            if item:
-                                new_value = item.text().strip()
-                                old_value = feature[field_name]
-                                
-                                # Convert value based on field type
-                                converted_value = self._convert_value_for_field(new_value, fields[col])
-                                
-                                # Check if value actually changed
-                                if converted_value != old_value:
-                                    feature.setAttribute(field_name, converted_value)
-                                    feature_changed = True
-                    
-                    # If feature was changed, update it
-                    if feature_changed:
-                        self.layer.updateFeature(feature)
-                        changes_made += 1
-            
+
+            # Apply each changed feature's attributes in one call
+            for row, attr_changes in changes_by_row.items():
+                if self.layer.changeAttributeValues(self.model.feature_id(row), attr_changes):
+                    changes_made += 1
+
             # Commit changes
             if changes_made > 0:
                 success = self.layer.commitChanges()
                 if success:
-                    QMessageBox.information(
-                        self,
-                        "Update Successful",
-                        f"Successfully updated {changes_made} features in layer '{self.layer.name()}'"
-                    )
-                    self.status_label.setText(f"Updated {changes_made} features successfully")
-                    
-                    # Refresh the data to show current values
-                    self.load_data()
+                    # The model already matches the committed state; just
+                    # accept it as the new baseline instead of reloading
+                    self.model.mark_committed()
+                    skipped_note = (f" ({invalid_skipped} invalid cells skipped)"
+                                    if invalid_skipped else "")
+                    self.status_label.setText(
+                        f"Updated {changes_made} features successfully "
+                        f"({self.model.rowCount()} features, "
+                        f"{self.model.columnCount()} fields){skipped_note}")
                 else:
                     QMessageBox.critical(
                         self,
@@ -312,84 +735,71 @@ class AttributeTableWidget(QWidget):
             QMessageBox.critical(self, "Update Error", f"Failed to update layer:\n{str(e)}")
             self.status_label.setText(f"Update error: {str(e)}")
     
-    def _convert_value_for_field(self, value, field):
-        """Convert a string value to the appropriate type for a field."""
+    @contextmanager
+    def _silent(self):
+        """Suppress view and selection signals while mutating cells in bulk.
+
+        The model still emits its single coalesced dataChanged, so the view
+        repaints once; only the per-event Python handlers are skipped.
+        """
+        selection_model = self.table.selectionModel()
+        self.table.blockSignals(True)
+        if selection_model:
+            selection_model.blockSignals(True)
         try:
-            if value == "" or value.lower() in ["null", "none", ""]:
-                return NULL
-            
-            field_type = field.type()
-            
-            # Handle different field types
-            if field_type in [1, 2]:  # Integer types
-                return int(value) if value else NULL
-            elif field_type in [3, 4]:  # Double/Real types
-                return float(value) if value else NULL
-            elif field_type == 6:  # String type
-                return value if value else NULL
-            elif field_type == 10:  # Date type
-                from datetime import datetime
-                return datetime.strptime(value, "%Y-%m-%d").date() if value else NULL
-            else:
-                # For other types, try to return as string
-                return value if value else NULL
-                
-        except (ValueError, TypeError):
-            # If conversion fails, return the original value
-            return value
-    
-    def on_cell_changed(self, item):
-        """Track when a cell value changes."""
-        if item:
-            row = item.row()
-            col = item.column()
-            new_value = item.text()
-            original_value = self.original_data.get((row, col), "")
-            
-            if new_value != original_value:
-                self.changed_cells.add((row, col))
-                
-                # Validate data against field type
-                field = self.get_field_by_column(col)
-                if field:
-                    is_valid, _ = self.validate_data_for_field(new_value, field)
-                    if is_valid:
-                        item.setBackground(Qt.yellow)  # Valid but unsaved
-                    else:
-                        item.setBackground(Qt.red)  # Invalid data
-                else:
-                    item.setBackground(Qt.yellow)  # Fallback to yellow
-            else:
-                self.changed_cells.discard((row, col))
-                # Reset background
-                item.setBackground(Qt.white)
-    
+            yield
+        finally:
+            self.table.blockSignals(False)
+            if selection_model:
+                selection_model.blockSignals(False)
+
+    def _selected_ranges(self):
+        """Return the current selection as a list of QItemSelectionRange."""
+        selection_model = self.table.selectionModel()
+        if not selection_model:
+            return []
+        return list(selection_model.selection())
+
     def on_selection_changed(self, selected, deselected):
-        """Handle selection changes to provide visual feedback."""
+        """Defer the selection summary so drag-selects don't recompute it per event."""
+        self._sel_timer.start()
+
+    def _update_sel_status(self):
+        """Update the status bar with a summary of the current selection."""
         try:
-            selected_ranges = self.table.selectedRanges()
+            selected_ranges = self._selected_ranges()
             if selected_ranges:
-                total_cells = sum((range.bottomRow() - range.topRow() + 1) * 
-                                (range.rightColumn() - range.leftColumn() + 1) 
+                total_cells = sum((range.bottom() - range.top() + 1) *
+                                (range.right() - range.left() + 1)
                                 for range in selected_ranges)
-                
+
+                # Skip the label rebuild when the visible summary is
+                # unchanged; the key carries each range's dimensions, since
+                # e.g. 1x4 and 2x2 share count and total but render differently
+                sel_key = tuple((r.bottom() - r.top() + 1, r.right() - r.left() + 1)
+                                for r in selected_ranges)
+                if sel_key == self._last_sel_key:
+                    return
+                self._last_sel_key = sel_key
+
                 if total_cells == 1:
                     self.status_label.setText("1 cell selected - ready to copy or edit")
                 else:
                     range_info = []
                     for i, range_obj in enumerate(selected_ranges):
-                        rows = range_obj.bottomRow() - range_obj.topRow() + 1
-                        cols = range_obj.rightColumn() - range_obj.leftColumn() + 1
+                        rows = range_obj.bottom() - range_obj.top() + 1
+                        cols = range_obj.right() - range_obj.left() + 1
                         range_info.append(f"{rows}×{cols}")
-                    
+
                     self.status_label.setText(f"{total_cells} cells selected across {len(selected_ranges)} range(s): {', '.join(range_info)} - ready to copy")
             else:
+                self._last_sel_key = None
                 self.status_label.setText("No cells selected")
-                
+
         except Exception as e:
             # Don't show error for selection changes, just log it
             pass
-    
+
     def revert_changes(self):
         """Revert all changes back to original values."""
         try:
@@ -400,59 +810,29 @@ class AttributeTableWidget(QWidget):
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
-            
+
             if reply == QMessageBox.Yes:
-                # Revert each changed cell
-                for row, col in self.changed_cells:
-                    item = self.table.item(row, col)
-                    if item:
-                        original_value = self.original_data.get((row, col), "")
-                        item.setText(original_value)
-                        item.setBackground(Qt.white)
-                
-                # Clear changed cells set
-                self.changed_cells.clear()
-                
+                # Restore every changed cell from the model's snapshot
+                with self._silent():
+                    self.model.revert_all()
+
                 QMessageBox.information(self, "Revert Complete", "All changes have been reverted.")
                 self.status_label.setText("Changes reverted successfully")
-                
+
         except Exception as e:
             QMessageBox.critical(self, "Revert Error", f"Failed to revert changes:\n{str(e)}")
             self.status_label.setText(f"Revert error: {str(e)}")
-    
+
     def show_context_menu(self, position):
-        """Show context menu for the table."""
-        context_menu = QMenu()
-        
-        # Add "Edit Cell" action
-        edit_action = context_menu.addAction("Edit Cell")
-        edit_action.triggered.connect(self.edit_current_cell)
-        
-        context_menu.addSeparator()
-        
-        # Add "Copy Selection" action
-        copy_action = context_menu.addAction("Copy Selection")
-        copy_action.triggered.connect(self.copy_selection)
-        
-        # Add "Paste from Spreadsheet" action
-        paste_action = context_menu.addAction("Paste from Spreadsheet")
-        paste_action.triggered.connect(self.paste_from_excel)
-        
-        context_menu.addSeparator()
-        
-        # Add "Make All Editable" action
-        make_editable_action = context_menu.addAction("Make All Cells Editable")
-        make_editable_action.triggered.connect(self._make_all_cells_editable)
-        
-        # Show the context menu
-        context_menu.exec_(self.table.mapToGlobal(position))
-    
+        """Show the prebuilt context menu for the table."""
+        self._ctx_menu.exec_(self.table.viewport().mapToGlobal(position))
+
     def edit_current_cell(self):
         """Start editing the current cell."""
-        current_item = self.table.currentItem()
-        if current_item:
-            self.table.editItem(current_item)
-    
+        current_index = self.table.currentIndex()
+        if current_index.isValid():
+            self.table.edit(current_index)
+
     def table_key_press_event(self, event):
         """Handle keyboard events for the table."""
         if event.key() == Qt.Key_F2:
@@ -461,20 +841,20 @@ class AttributeTableWidget(QWidget):
         elif event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
             # Enter key starts editing
             self.edit_current_cell()
-        elif event.matches(Qt.CTRL + Qt.Key_C):
+        elif event.matches(QKeySequence.Copy):
             # Ctrl+C for copy
             self.copy_selection()
-        elif event.matches(Qt.CTRL + Qt.Key_V):
+        elif event.matches(QKeySequence.Paste):
             # Ctrl+V for paste
             self.paste_from_excel()
         else:
             # Call the original keyPressEvent
-            QTableWidget.keyPressEvent(self.table, event)
+            QTableView.keyPressEvent(self.table, event)
     
     def copy_selection(self):
         """Copy selected cells to clipboard in Excel-compatible format."""
         try:
-            selected_ranges = self.table.selectedRanges()
+            selected_ranges = self._selected_ranges()
             if not selected_ranges:
                 QMessageBox.information(self, "Copy", "Please select cells to copy first.\n\n"
                                    "You can select multiple cells by:\n"
@@ -482,33 +862,37 @@ class AttributeTableWidget(QWidget):
                                    "• Holding Ctrl while clicking to select individual cells\n"
                                    "• Holding Shift while clicking to extend selection")
                 return
-            
-            clipboard_text = ""
+
+            # Process ranges top-to-bottom so multi-range copies come out in
+            # table order rather than selection order
+            selected_ranges.sort(key=lambda r: (r.top(), r.left()))
+
+            # Collect row strings and join once; += concatenation is O(cells^2)
+            buf = []
+            range_info = []
             total_cells = 0
-            
-            for selected_range in selected_ranges:
-                for row in range(selected_range.topRow(), selected_range.bottomRow() + 1):
-                    row_data = []
-                    for col in range(selected_range.leftColumn(), selected_range.rightColumn() + 1):
-                        item = self.table.item(row, col)
-                        cell_text = item.text() if item else ""
+
+            for i, selected_range in enumerate(selected_ranges):
+                left = selected_range.left()
+                width = selected_range.right() - left + 1
+                height = selected_range.bottom() - selected_range.top() + 1
+                range_info.append(f"Range {i+1}: {height}×{width} cells")
+                for row in range(selected_range.top(), selected_range.bottom() + 1):
+                    # Selection ranges are in proxy coordinates
+                    source_row = self.proxy.mapToSource(self.proxy.index(row, 0)).row()
+                    row_data = [None] * width
+                    for offset in range(width):
+                        cell_text = self.model.value(source_row, left + offset)
                         # Escape quotes and wrap in quotes if contains comma or newline
                         if "," in cell_text or "\n" in cell_text or '"' in cell_text:
-                            cell_text = f'"{cell_text.replace('"', '""')}"'
-                        row_data.append(cell_text)
+                            cell_text = '"' + cell_text.translate(_QUOTE_ESCAPE_MAP) + '"'
+                        row_data[offset] = cell_text
                         total_cells += 1
-                    clipboard_text += "\t".join(row_data) + "\n"
-            
-            clipboard_text = clipboard_text.strip()
+                    buf.append("\t".join(row_data))
+
+            clipboard_text = "\n".join(buf)
             QApplication.clipboard().setText(clipboard_text)
             
-            # Show detailed success message
-            range_info = []
-            for i, range_obj in enumerate(selected_ranges):
-                rows = range_obj.bottomRow() - range_obj.topRow() + 1
-                cols = range_obj.rightColumn() - range_obj.leftColumn() + 1
-                range_info.append(f"Range {i+1}: {rows}×{cols} cells")
-            
             QMessageBox.information(self, "Copy Successful", 
                                   f"✅ Successfully copied {total_cells} cells to clipboard!\n\n"
                                   f"Selection details:\n" + "\n".join(range_info) + "\n\n"
@@ -531,82 +915,54 @@ class AttributeTableWidget(QWidget):
                 return
             
             # Get current selection
-            selected_ranges = self.table.selectedRanges()
+            selected_ranges = self._selected_ranges()
             if not selected_ranges:
                 QMessageBox.information(self, "Paste", "Please select a starting cell first.\n\n"
                                    "Click on the cell where you want to paste the data.")
                 return
-            
-            start_row = selected_ranges[0].topRow()
-            start_col = selected_ranges[0].leftColumn()
-            
-            # Parse clipboard data
-            rows = clipboard_text.strip().split('\n')
-            if not rows:
-                return
-            
-            # Count total cells to be pasted
+
+            # Map the paste anchor from proxy to source coordinates
+            start_index = self.proxy.mapToSource(
+                self.proxy.index(selected_ranges[0].top(), selected_ranges[0].left()))
+            start_row = start_index.row()
+            start_col = start_index.column()
+
+            # Parse clipboard data once into per-row value lists
+            parsed_rows = []
             total_cells = 0
-            for row in rows:
-                columns = row.split('\t')
-                total_cells += len(columns)
-            
+            for line in clipboard_text.strip().splitlines():
+                row_values = line.split('\t')
+                for j, cell_text in enumerate(row_values):
+                    # Remove quotes if present
+                    if cell_text.startswith('"') and cell_text.endswith('"'):
+                        row_values[j] = cell_text[1:-1].replace('""', '"')
+                total_cells += len(row_values)
+                parsed_rows.append(row_values)
+
+            if not parsed_rows:
+                return
+
             # Confirm paste operation
             reply = QMessageBox.question(
                 self,
                 "Confirm Paste",
-                f"This will paste {len(rows)} rows with {len(rows[0].split('\\t'))} columns "
+                f"This will paste {len(parsed_rows)} rows with {len(parsed_rows[0])} columns "
                 f"({total_cells} total cells) starting at row {start_row + 1}, column {start_col + 1}.\n\n"
                 "Any existing data in these cells will be overwritten.\n\n"
                 "Do you want to continue?",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
-            
+
             if reply == QMessageBox.No:
                 return
-            
-            # Paste the data
-            changes_made = 0
-            invalid_cells = 0
-            for i, row in enumerate(rows):
-                if start_row + i >= self.table.rowCount():
-                    break
-                    
-                columns = row.split('\t')
-                for j, cell_text in enumerate(columns):
-                    if start_col + j >= self.table.columnCount():
-                        break
-                    
-                    # Remove quotes if present
-                    if cell_text.startswith('"') and cell_text.endswith('"'):
-                        cell_text = cell_text[1:-1].replace('""', '"')
-                    
-                    # Set the cell value
-                    target_row = start_row + i
-                    target_col = start_col + j
-                    
-                    item = self.table.item(target_row, target_col)
-                    if item:
-                        old_value = item.text()
-                        if cell_text != old_value:
-                            item.setText(cell_text)
-                            # Mark as changed
-                            self.changed_cells.add((target_row, target_col))
-                            
-                            # Validate data against field type
-                            field = self.get_field_by_column(target_col)
-                            if field:
-                                is_valid, _ = self.validate_data_for_field(cell_text, field)
-                                if is_valid:
-                                    item.setBackground(Qt.yellow)  # Valid but unsaved
-                                else:
-                                    item.setBackground(Qt.red)  # Invalid data
-                                    invalid_cells += 1
-                            else:
-                                item.setBackground(Qt.yellow)  # Fallback to yellow
-                            
-                            changes_made += 1
+
+            # Bulk-assign the block; the model validates, tracks changes and
+            # notifies the view with a single dataChanged rectangle
+            with self._silent():
+                self.model.ensure_loaded_through(start_row + len(parsed_rows) - 1)
+                changes_made, invalid_cells = self.model.paste_block(
+                    start_row, start_col, parsed_rows)
             
             if changes_made > 0:
                 if invalid_cells > 0:
@@ -665,10 +1021,11 @@ class AttributeTableWidget(QWidget):
 
     def get_field_by_column(self, column):
         """Get the field object for a given column index."""
-        if hasattr(self, 'layer') and self.layer:
+        fields = self._fields
+        if fields is None and hasattr(self, 'layer') and self.layer:
             fields = self.layer.fields()
-            if 0 <= column < len(fields):
-                return fields[column]
+        if fields is not None and 0 <= column < len(fields):
+            return fields[column]
         return None
 
     def get_user_friendly_type_name(self, qgis_type_name):
@@ -884,15 +1241,76 @@ class AttributeManagerDialog(QDialog):
         :param parent: Parent widget
         """
         super().__init__(parent)
-        
+
         self.setWindowTitle('Layer Attribute Manager')
         self.setModal(False)
         self.resize(800, 600)
-        
+
+        # Vector-layer caches, kept in sync incrementally by add_layers/
+        # remove_layers so project-wide rescans stay off the signal path
+        self._vector_layers = {}  # layer id -> QgsVectorLayer
+        self._combo_layer_ids = []  # layer id per combo row, kept in sync
+
+        # LRU cache of table widgets so revisiting a layer skips the
+        # provider re-fetch entirely
+        self._widget_cache = OrderedDict()  # layer id -> AttributeTableWidget
+        self._cache_max = 4
+        self._current_layer_id = None  # id of the layer currently shown
+        self._settings_dialog = None  # built on first use, then reused
+
+        # Layer list refreshes are deferred while the dialog is hidden;
+        # the flag makes showEvent catch up on the first/next show
+        self._layers_dirty = True
+
         self.init_ui()
         self.refresh_layers()
         self.select_first_layer()
 
+    def _rescan_vector_layers(self):
+        """Rebuild the vector-layer caches from the current project."""
+        self._vector_layers = {
+            layer_id: layer
+            for layer_id, layer in QgsProject.instance().mapLayers().items()
+            if layer.type() == QgsMapLayer.VectorLayer}
+
+    def add_layers(self, layers):
+        """Incrementally register newly added vector layers.
+
+        :param layers: layers from QgsProject.layersAdded
+        """
+        added = 0
+        for layer in layers:
+            if (layer.type() == QgsMapLayer.VectorLayer
+                    and layer.id() not in self._vector_layers):
+                self._vector_layers[layer.id()] = layer
+                self._combo_layer_ids.append(layer.id())
+                self.layer_combo.addItem(layer.name())
+                added += 1
+        if added:
+            self.status_label.setText(f'Loaded {len(self._vector_layers)} vector layers')
+
+    def remove_layers(self, layer_ids):
+        """Incrementally drop removed layers from the caches and combo.
+
+        :param layer_ids: layer ids from QgsProject.layersRemoved
+        """
+        for layer_id in layer_ids:
+            layer = self._vector_layers.pop(layer_id, None)
+            if layer is None:
+                continue
+            widget = self._widget_cache.pop(layer_id, None)
+            if widget is not None:
+                if widget is self.table_widget:
+                    self.table_widget = None
+                    self._current_layer_id = None
+                    self._stack.setCurrentWidget(self.placeholder_label)
+                self._stack.removeWidget(widget)
+                widget.deleteLater()
+            if layer_id in self._combo_layer_ids:
+                index = self._combo_layer_ids.index(layer_id)
+                del self._combo_layer_ids[index]
+                self.layer_combo.removeItem(index)
+
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout()
@@ -964,6 +1382,10 @@ class AttributeManagerDialog(QDialog):
         
         layer_layout.addWidget(QLabel('Select Layer:'))
         self.layer_combo = QComboBox()
+        # String-list model so a full rebuild is one model reset instead of
+        # one rowsInserted per layer
+        self._combo_model = QStringListModel(self.layer_combo)
+        self.layer_combo.setModel(self._combo_model)
         self.layer_combo.currentTextChanged.connect(self.on_layer_changed)
         layer_layout.addWidget(self.layer_combo)
         
@@ -975,12 +1397,15 @@ class AttributeManagerDialog(QDialog):
         layer_group.setLayout(layer_layout)
         layout.addWidget(layer_group)
         
-        # Single attribute table widget (replaces tabs)
+        # Stacked area holding the placeholder and the cached table widgets;
+        # switching the visible widget is O(1) with no re-parenting
         self.table_widget = None
         self.placeholder_label = QLabel('Select a layer to view its attribute table...')
         self.placeholder_label.setAlignment(Qt.AlignCenter)
         self.placeholder_label.setStyleSheet("QLabel { color: #666; font-style: italic; padding: 50px; }")
-        layout.addWidget(self.placeholder_label)
+        self._stack = QStackedWidget()
+        self._stack.addWidget(self.placeholder_label)
+        layout.addWidget(self._stack)
         
         # Status bar
         self.status_label = QLabel('Ready')
@@ -998,126 +1423,140 @@ class AttributeManagerDialog(QDialog):
         
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Catch up on any layer changes that arrived while hidden."""
+        super().showEvent(event)
+        if self._layers_dirty:
+            self.refresh_layers()
+
     def refresh_layers(self):
         """Refresh the layer list and current table data while preserving current selection."""
+        if not self.isVisible():
+            # Nothing to show yet; remember to refresh on the next show
+            self._layers_dirty = True
+            return
+        self._layers_dirty = False
         try:
             # Remember current selection
             current_selection = self.layer_combo.currentText()
-            
-            # Temporarily disconnect the signal to prevent triggering on_layer_changed
-            self.layer_combo.currentTextChanged.disconnect(self.on_layer_changed)
-            
-            # Get vector layers
-            vector_layers = [layer for layer in QgsProject.instance().mapLayers().values() 
-                           if isinstance(layer, QgsVectorLayer)]
-            
-            # Update layer combo
-            self.layer_combo.clear()
-            self.layer_combo.addItems([layer.name() for layer in vector_layers])
-            
-            # Try to restore previous selection
-            if current_selection:
-                index = self.layer_combo.findText(current_selection)
-                if index >= 0:
-                    self.layer_combo.setCurrentIndex(index)
-                    # Refresh the current table data without recreating the widget
-                    if self.table_widget and hasattr(self.table_widget, 'load_data'):
-                        self.table_widget.load_data()
-                else:
-                    # If previous selection is no longer available, select first layer if any
-                    if vector_layers:
-                        self.layer_combo.setCurrentIndex(0)
-            elif vector_layers:
-                # If no previous selection, select first layer
-                self.layer_combo.setCurrentIndex(0)
-            
-            # Reconnect the signal
-            self.layer_combo.currentTextChanged.connect(self.on_layer_changed)
-            
-            if vector_layers:
-                self.status_label.setText(f'Loaded {len(vector_layers)} vector layers')
+
+            # Get vector layers; one pre-sized pass fills both the id list
+            # and the name list instead of two comprehensions
+            self._rescan_vector_layers()
+            layer_count = len(self._vector_layers)
+            layer_ids = [None] * layer_count
+            layer_names = [None] * layer_count
+            for i, layer in enumerate(self._vector_layers.values()):
+                layer_ids[i] = layer.id()
+                layer_names[i] = layer.name()
+
+            # Block combo signals for the rebuild; exception-safe, and the
+            # slot connected in init_ui never has to be touched
+            with QSignalBlocker(self.layer_combo):
+                # Update layer combo in one model reset
+                self._combo_layer_ids = layer_ids
+                self._combo_model.setStringList(layer_names)
+
+                # Try to restore previous selection
+                if current_selection:
+                    index = self.layer_combo.findText(current_selection)
+                    if index >= 0:
+                        self.layer_combo.setCurrentIndex(index)
+                        # Refresh the current table data without recreating the widget
+                        if self.table_widget and hasattr(self.table_widget, 'load_data'):
+                            self.table_widget.load_data()
+                    else:
+                        # If previous selection is no longer available, select first layer if any
+                        if layer_count:
+                            self.layer_combo.setCurrentIndex(0)
+                elif layer_count:
+                    # If no previous selection, select first layer
+                    self.layer_combo.setCurrentIndex(0)
+
+            if layer_count:
+                self.status_label.setText(f'Loaded {layer_count} vector layers')
             else:
                 self.status_label.setText('No vector layers found')
-                
+
         except Exception as e:
-            # Make sure to reconnect the signal even if there's an error
-            try:
-                self.layer_combo.currentTextChanged.connect(self.on_layer_changed)
-            except:
-                pass
-            QMessageBox.critical(self, 'Error Refreshing Layers', f"Error refreshing layers:\n{str(e)}\n\n"
-                               f"This might be a compatibility issue with your QGIS version.")
+            # Deferred so the modal's event pumping cannot re-enter this
+            # handler while it is still unwinding
+            QTimer.singleShot(0, partial(
+                QMessageBox.critical, self, 'Error Refreshing Layers',
+                f"Error refreshing layers:\n{str(e)}\n\n"
+                f"This might be a compatibility issue with your QGIS version."))
             self.status_label.setText(f"Error refreshing layers: {str(e)}")
 
     def select_first_layer(self):
-        """Select the first available layer if any exist (only on initial load)."""
-        try:
-            vector_layers = [layer for layer in QgsProject.instance().mapLayers().values() 
-                           if isinstance(layer, QgsVectorLayer)]
-            
-            if vector_layers and self.layer_combo.count() > 0:
-                # Select the first layer (index 0, since there's no placeholder)
-                self.layer_combo.setCurrentIndex(0)
-        except Exception as e:
-            # Don't let this break the dialog
-            pass
+        """Select the first available layer if none is selected yet."""
+        # The combo was just populated by refresh_layers, so it is the
+        # source of truth here — no need to consult the project again
+        if self.layer_combo.count() > 0 and self.layer_combo.currentIndex() < 0:
+            self.layer_combo.setCurrentIndex(0)
 
     def on_layer_changed(self, layer_name):
         """Handle layer selection change."""
         if not layer_name:
-            # No layer selected, show placeholder
-            if self.table_widget:
-                self.layout().removeWidget(self.table_widget)
-                self.table_widget.setParent(None)
-                self.table_widget = None
-            
-            # Show placeholder
-            self.placeholder_label.setVisible(True)
+            # No layer selected, show the placeholder
+            self._stack.setCurrentWidget(self.placeholder_label)
+            self.table_widget = None
+            self._current_layer_id = None
             return
-        
-        # Find the selected layer
-        vector_layers = [layer for layer in QgsProject.instance().mapLayers().values() 
-                       if isinstance(layer, QgsVectorLayer)]
-        
+
+        # Resolve by layer id (combo row -> id), which stays correct even
+        # when two layers share a name
+        index = self.layer_combo.currentIndex()
         selected_layer = None
-        for layer in vector_layers:
-            if layer.name() == layer_name:
-                selected_layer = layer
-                break
-        
+        if 0 <= index < len(self._combo_layer_ids):
+            selected_layer = self._vector_layers.get(self._combo_layer_ids[index])
+
         if selected_layer:
-            # Check if we already have a table widget for this layer
-            if (self.table_widget and 
-                hasattr(self.table_widget, 'layer') and 
-                self.table_widget.layer.name() == layer_name):
-                # Same layer, just refresh the data
-                self.table_widget.load_data()
+            layer_id = selected_layer.id()
+
+            # Already showing this layer (ids are stable across renames,
+            # unlike names) — nothing to rebuild
+            if layer_id == self._current_layer_id:
                 return
-            
-            # Remove current table widget if exists
-            if self.table_widget:
-                self.layout().removeWidget(self.table_widget)
-                self.table_widget.setParent(None)
-            
-            # Hide placeholder
-            self.placeholder_label.setVisible(False)
-            
-            # Create new table widget for selected layer
+
+            # Cache hit: bring the widget to the front without re-reading
+            # the layer; its model is still loaded
+            cached = self._widget_cache.get(layer_id)
+            if cached is not None:
+                self._widget_cache.move_to_end(layer_id)
+                self._stack.setCurrentWidget(cached)
+                self.table_widget = cached
+                self._current_layer_id = layer_id
+                return
+
             try:
-                self.table_widget = AttributeTableWidget(selected_layer)
-                # Insert the table widget before the status label
-                layout = self.layout()
-                layout.insertWidget(layout.count() - 2, self.table_widget)
+                widget = AttributeTableWidget(selected_layer)
             except Exception as e:
-                QMessageBox.critical(self, 'Error Loading Data', f"Failed to load layer '{layer_name}':\n{str(e)}")
+                # Deferred for the same re-entrancy reason as refresh_layers
+                QTimer.singleShot(0, partial(
+                    QMessageBox.critical, self, 'Error Loading Data',
+                    f"Failed to load layer '{layer_name}':\n{str(e)}"))
                 self.status_label.setText(f"Error loading layer: {str(e)}")
+                return
+
+            self._widget_cache[layer_id] = widget
+            if len(self._widget_cache) > self._cache_max:
+                # Evict the least recently shown widget
+                _, evicted = self._widget_cache.popitem(last=False)
+                self._stack.removeWidget(evicted)
+                evicted.deleteLater()
+
+            self._stack.addWidget(widget)
+            self._stack.setCurrentWidget(widget)
+            self.table_widget = widget
+            self._current_layer_id = layer_id
 
     def show_settings(self):
         """Show the plugin settings dialog."""
         try:
-            from .settings_dialog import SettingsDialog
-            settings_dialog = SettingsDialog(self)
-            settings_dialog.exec_()
+            if self._settings_dialog is None:
+                from .settings_dialog import SettingsDialog
+                self._settings_dialog = SettingsDialog(self)
+            self._settings_dialog.exec_()
         except Exception as e:
             QMessageBox.critical(self, 'Error Opening Settings', 
                                 f'Error opening settings:\n{str(e)}')
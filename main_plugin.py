@@ -7,10 +7,25 @@ A powerful plugin to manage and edit attribute tables for all layers in one inte
 import os
 import logging
 from qgis.PyQt.QtWidgets import QAction, QMessageBox, QToolBar
+from qgis.PyQt.QtCore import QObject, QTimer
 from qgis.PyQt.QtGui import QIcon
 from qgis.core import QgsProject, QgsVectorLayer, QgsFeature, QgsField
 from qgis.utils import iface
-from .attribute_manager_dialog import AttributeManagerDialog
+
+# Icons directory, resolved once at import instead of per lookup
+_ICONS_DIR = os.path.join(os.path.dirname(__file__), 'icons')
+
+# Decoded icons, keyed by file name; each icon is read from disk once
+_ICON_CACHE = {}
+
+
+def _get_icon(name):
+    """Return the QIcon for a file in the plugin icons directory, memoized."""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon(os.path.join(_ICONS_DIR, name))
+        _ICON_CACHE[name] = icon
+    return icon
 
 
 class AttributeManagerPlugin:
@@ -30,10 +45,23 @@ class AttributeManagerPlugin:
         self.dialog = None
         self.toolbar = None
         self.action_open_manager = None
+
+        # Signal connection handles, kept for O(1) disconnect in unload()
+        self._conn_added = None
+        self._conn_removed = None
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
-        
+
+        # Coalesce layersAdded/layersRemoved bursts (e.g. a bulk project
+        # open) into a single dialog update instead of one per emission
+        self._pending_added = []
+        self._pending_removed = []
+        self._refresh_timer = QTimer()
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._flush_layer_changes)
+
 
     def initGui(self):
         """Called when the plugin is loaded. This method is required by QGIS."""
@@ -55,20 +83,12 @@ class AttributeManagerPlugin:
             self.toolbar = self.iface.addToolBar('Layer Attribute Manager')
             self.toolbar.setObjectName('AttributeManagerToolbar')
             
-            # Create actions with icon fallbacks
-            plugin_dir = os.path.dirname(__file__)
-            
-            # Try to load icons, use fallback if they fail
-            try:
-                main_icon = QIcon(os.path.join(plugin_dir, 'icons', 'main.ico'))
-                if main_icon.isNull():
-                    # Create a fallback icon
-                    main_icon = QIcon()
-                    self.logger.warning("Main icon could not be loaded, using fallback")
-            except Exception as e:
-                self.logger.warning(f"Could not load main icon: {e}")
-                main_icon = QIcon()
-            
+            # Icons come from the module-level cache; a missing file just
+            # yields a null QIcon, which Qt renders as no icon
+            main_icon = _get_icon('main.ico')
+            if main_icon.isNull():
+                self.logger.warning("Main icon could not be loaded, using fallback")
+
             # Create action with fallback icon
             self.action_open_manager = QAction(
                 main_icon,
@@ -86,9 +106,9 @@ class AttributeManagerPlugin:
             
             # Connect project signals with error handling
             try:
-                if hasattr(self, 'project') and self.project:
-                    self.project.layersAdded.connect(self.on_layer_added)
-                    self.project.layersRemoved.connect(self.on_layer_removed)
+                if self.project:
+                    self._conn_added = self.project.layersAdded.connect(self.on_layer_added)
+                    self._conn_removed = self.project.layersRemoved.connect(self.on_layer_removed)
                     self.logger.info("Project signals connected successfully")
                 else:
                     self.logger.warning("Project not available, signals not connected")
@@ -103,6 +123,9 @@ class AttributeManagerPlugin:
         """Open the attribute manager dialog."""
         try:
             if not self.dialog:
+                # Imported lazily so QGIS startup does not pay for the
+                # table/model stack; only the first open does
+                from .attribute_manager_dialog import AttributeManagerDialog
                 self.dialog = AttributeManagerDialog(self.iface.mainWindow())
             
             self.dialog.show()
@@ -117,20 +140,45 @@ class AttributeManagerPlugin:
 
     def on_layer_added(self, layers):
         """Handle when new layers are added to the project."""
-        if self.dialog and self.dialog.isVisible():
-            self.dialog.refresh_layers()
+        self._pending_added.extend(layers)
+        self._refresh_timer.start()
 
-    def on_layer_removed(self, layers):
+    def on_layer_removed(self, layer_ids):
         """Handle when layers are removed from the project."""
-        if self.dialog and self.dialog.isVisible():
+        self._pending_removed.extend(layer_ids)
+        self._refresh_timer.start()
+
+    def _flush_layer_changes(self):
+        """Apply the accumulated layer additions/removals in one pass."""
+        added = self._pending_added
+        removed = self._pending_removed
+        self._pending_added = []
+        self._pending_removed = []
+        if not self.dialog:
+            return
+        if self.dialog.isVisible():
+            if removed:
+                self.dialog.remove_layers(removed)
+            if added:
+                self.dialog.add_layers(added)
+        else:
+            # Hidden dialog: this just flags the layer list dirty so the
+            # next show catches up in one pass
             self.dialog.refresh_layers()
-    
+
 
     def unload(self):
         """Unload the plugin."""
         try:
-            # Remove toolbar
-            if hasattr(self, 'toolbar') and self.toolbar:
+            # Stop the debounce timer first so a pending timeout cannot
+            # fire _flush_layer_changes during or after teardown
+            self._refresh_timer.stop()
+            self._pending_added = []
+            self._pending_removed = []
+
+            # Remove toolbar; all of these attributes are set in __init__,
+            # so plain truthiness checks are enough
+            if self.toolbar:
                 try:
                     self.iface.removeToolBar(self.toolbar)
                     self.logger.info("Toolbar removed successfully")
@@ -138,24 +186,29 @@ class AttributeManagerPlugin:
                     self.logger.warning(f"Could not remove toolbar: {e}")
             
             # Remove menu items
-            if hasattr(self, 'action_open_manager') and self.action_open_manager:
+            if self.action_open_manager:
                 try:
                     self.iface.removePluginMenu('Layer Attribute Manager', self.action_open_manager)
                 except Exception as e:
                     self.logger.warning(f"Could not remove open manager menu: {e}")
             
             
-            # Disconnect signals
-            if hasattr(self, 'project') and self.project:
-                try:
-                    self.project.layersAdded.disconnect(self.on_layer_added)
-                    self.project.layersRemoved.disconnect(self.on_layer_removed)
-                    self.logger.info("Project signals disconnected successfully")
-                except Exception as e:
-                    self.logger.warning(f"Could not disconnect project signals: {e}")
+            # Disconnect signals via the stored connection handles, which
+            # avoids the slot-list scan of disconnect(slot) and is inert
+            # if the connect never happened
+            try:
+                if self._conn_added is not None:
+                    QObject.disconnect(self._conn_added)
+                    self._conn_added = None
+                if self._conn_removed is not None:
+                    QObject.disconnect(self._conn_removed)
+                    self._conn_removed = None
+                self.logger.info("Project signals disconnected successfully")
+            except Exception as e:
+                self.logger.warning(f"Could not disconnect project signals: {e}")
             
             # Close dialog if open
-            if hasattr(self, 'dialog') and self.dialog:
+            if self.dialog:
                 try:
                     self.dialog.close()
                     self.dialog = None
@@ -22,8 +22,16 @@ class SettingsDialog(QDialog):
         self.setWindowTitle('Layer Attribute Manager - Settings')
         self.setModal(True)
         self.resize(400, 300)
-        
-        self.init_ui()
+
+        # Widgets are built lazily on the first show
+        self._ui_built = False
+
+    def showEvent(self, event):
+        """Build the user interface on first show only."""
+        if not self._ui_built:
+            self.init_ui()
+            self._ui_built = True
+        super().showEvent(event)
 
     def init_ui(self):
         """Initialize the user interface."""